@@ -0,0 +1,37 @@
+import os
+from decouple import config
+from lipipala.config import settings
+
+bind = f"{settings.host}:{settings.port}"
+
+_cpus = os.cpu_count() or 1
+
+# gevent only overlaps socket I/O: a worker reads slow uploads and answers
+# /health and /languages without tying itself up, but an inference call never
+# yields to the hub and holds the whole worker until it returns, GIL or not.
+# Keep the per-worker connection limit small so requests queue for a free
+# worker rather than piling up behind one busy forward pass.
+worker_class = "gevent"
+worker_connections = 8
+# Inference is CPU-bound, so more workers than cores only adds contention.
+# Memory scales with workers too: N workers hold N full copies of every
+# model, in RAM or GPU memory. Size WEB_CONCURRENCY for that, and run a single
+# worker on GPU hosts with WEB_CONCURRENCY=1.
+workers = config('WEB_CONCURRENCY', default=max(1, _cpus // 2), cast=int)
+
+# Split the cores between workers instead of letting each worker's torch
+# intra-op pool default to all of them. Workers inherit this environment
+# before torch is imported.
+os.environ.setdefault('OMP_NUM_THREADS', str(max(1, _cpus // workers)))
+
+# The app is deliberately not preloaded in the master: the gevent worker only
+# monkey-patches after fork, and torch's thread pools are not fork-safe once
+# started. Each worker loads its models at boot instead (see main.py).
+preload_app = False
+
+# Workers load every model in load_wsgi, before their first heartbeat, and
+# a forward pass blocks the heartbeat as well. The 30 s default kills
+# workers that are still booting, so allow time for loading (and warming up)
+# all models, and for in-flight transcriptions to finish on restart.
+timeout = config('GUNICORN_TIMEOUT', default=180, cast=int)
+graceful_timeout = config('GUNICORN_GRACEFUL_TIMEOUT', default=60, cast=int)
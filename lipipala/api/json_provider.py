@@ -0,0 +1,50 @@
+import orjson
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+
+def _reject_unsupported(kwargs) -> None:
+    if kwargs:
+        raise TypeError(
+            f"Unsupported arguments for orjson: {', '.join(sorted(kwargs))}")
+
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider that serializes with orjson instead of the stdlib."""
+
+    mimetype = 'application/json'
+    sort_keys = False
+    #: Fallback for types orjson cannot serialize natively, same as Flask's
+    default = staticmethod(DefaultJSONProvider.default)
+    # Accept non-str keys like the stdlib does, and hand dates to default so
+    # they come out as HTTP dates like Flask's rather than orjson's ISO 8601
+    _options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def _dumps_bytes(self, obj, **kwargs) -> bytes:
+        option = self._options
+        if kwargs.pop('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.pop('indent', None):
+            option |= orjson.OPT_INDENT_2
+        default = kwargs.pop('default', self.default)
+        _reject_unsupported(kwargs)
+        return orjson.dumps(obj, default=default, option=option)
+
+    def dumps(self, obj, **kwargs) -> str:
+        return self._dumps_bytes(obj, **kwargs).decode()
+
+    def loads(self, s, **kwargs):
+        _reject_unsupported(kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if args and kwargs:
+            raise TypeError("response() takes either args or kwargs, not both")
+        if not args and not kwargs:
+            obj = None
+        elif len(args) == 1:
+            obj = args[0]
+        else:
+            obj = args or kwargs
+        # Write orjson's bytes directly, skipping a str round trip
+        return self._app.response_class(
+            self._dumps_bytes(obj), mimetype=self.mimetype)
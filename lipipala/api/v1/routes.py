@@ -1,6 +1,7 @@
-from flask import Blueprint, request, jsonify
+import orjson
+from flask import Blueprint, Response, request, jsonify
 from lipipala.core.speech.service import SpeechRecognitionService
-from lipipala.core.speech.exceptions import SpeechServiceError
+from lipipala.core.speech.exceptions import LanguageNotSupportedError, SpeechServiceError
 from lipipala.config import settings
 
 # Create a Blueprint for v1 of the API
@@ -9,10 +10,13 @@ api_v1_bp = Blueprint('api_v1', __name__, url_prefix='/api/v1')
 # Initialize the service with the app's settings
 speech_service = SpeechRecognitionService(settings.speech_recognition)
 
+# The health payload never changes for the lifetime of the process
+_HEALTH_BODY = orjson.dumps({"status": "ok", "version": settings.version})
+
 
 @api_v1_bp.route('/health', methods=['GET'])
 def health_check():
-    return jsonify({"status": "ok", "version": settings.version})
+    return Response(_HEALTH_BODY, mimetype='application/json')
 
 
 @api_v1_bp.route('/speech/transcribe', methods=['POST'])
@@ -23,28 +27,26 @@ def transcribe_audio():
     audio_file = request.files['file']
     language = request.form['language']
 
-    # In a real app, you would save the file temporarily
-    # temp_path = f"/tmp/{audio_file.filename}"
-    # audio_file.save(temp_path)
-
     try:
-        # result = speech_service.transcribe(temp_path, language)
-        # For this example, we'll fake it since we can't save files
-        result = {
-            'language': language,
-            'text': 'Dummy transcription result.',
-            'confidence': 0.9,
-            'audio_duration': 5.0
-        }
+        # werkzeug has already spooled the upload (in memory when small), so
+        # decode straight from its stream rather than copying it again
+        audio_file.stream.seek(0)
+        result = speech_service.transcribe_stream(audio_file.stream, language)
         return jsonify(result), 200
     except SpeechServiceError as e:
         return jsonify({"error": str(e)}), 500
-    finally:
-        # os.remove(temp_path) # Clean up the temp file
-        pass
 
 
 @api_v1_bp.route('/speech/languages', methods=['GET'])
 def get_languages():
     languages = speech_service.get_supported_languages()
     return jsonify({"supported_languages": languages})
+
+
+@api_v1_bp.route('/speech/languages/<lang_code>', methods=['GET'])
+def get_language_info(lang_code):
+    try:
+        info = speech_service.get_language_info(lang_code)
+    except LanguageNotSupportedError as e:
+        return jsonify({"error": str(e)}), 404
+    return jsonify({"code": lang_code, **info.dict()})
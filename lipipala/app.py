@@ -1,20 +1,30 @@
 import logging
 from flask import Flask
 from lipipala.config import settings
-from lipipala.api.v1.routes import api_v1_bp
+from lipipala.api.json_provider import ORJSONProvider
+from lipipala.api.v1.routes import api_v1_bp, speech_service
 
 
-def create_app():
-    """Create and configure an instance of the Flask application."""
+def create_app(preload_models: bool = False):
+    """Create and configure an instance of the Flask application.
+
+    With ``preload_models`` every available ASR model is loaded before the
+    app is returned, so the first request for a language does not pay for
+    it. Call this in the serving process itself, not in a master that forks.
+    """
     app = Flask(__name__)
     app.config.from_object(settings)
+    app.json = ORJSONProvider(app)
 
-    # Configure logging
-    logging.basicConfig(level=logging.INFO,
+    # Configure logging; production only reports warnings and errors
+    logging.basicConfig(level=logging.INFO if settings.debug else logging.WARNING,
                         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
     # Register blueprints
     app.register_blueprint(api_v1_bp)
 
-    logging.info(f"{settings.app_name} v{settings.version} initialized.")
+    if preload_models:
+        speech_service.preload_models()
+
+    logging.info("%s v%s initialized.", settings.app_name, settings.version)
     return app
@@ -11,6 +11,12 @@ class SpeechRecognitionSettings(BaseModel):
     n_mels: int = 80
     n_fft: int = 400
     hop_length: int = 160
+    # Cache TorchScript versions of models next to their checkpoints
+    jit_cache: bool = False
+    # Quantize Linear/LSTM/GRU weights to int8 when running on CPU
+    int8_cpu: bool = True
+    # Largest number of files batch_transcribe sends through one forward pass
+    max_batch_size: int = 16
 
 
 class AppSettings(BaseModel):
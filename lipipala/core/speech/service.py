@@ -1,18 +1,203 @@
+import contextlib
 import logging
-import json
-import torch
-import librosa
-import numpy as np
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Tuple, Union
+
+import numpy as np
+import orjson
+import soundfile
+from pydantic import BaseModel, ValidationError
 
 from lipipala.config import SpeechRecognitionSettings
 from lipipala.core.speech.exceptions import LanguageNotSupportedError, AudioProcessingError, ModelLoadError
-# Assuming you have an ASRModel class defined somewhere, e.g., lipipala.models.asr_model
-# from lipipala.models.asr_model import ASRModel
+
+if TYPE_CHECKING:
+    import torch
 
 logger = logging.getLogger(__name__)
 
+# A path on disk or an open binary file object positioned at the audio data
+AudioSource = Union[str, Path, BinaryIO]
+
+# Upper bound on threads decoding audio files for batch_transcribe
+MAX_AUDIO_LOAD_WORKERS = 8
+
+
+class LanguageMeta(BaseModel):
+    """Descriptive metadata for a supported language."""
+    name: str = 'Unknown'
+    family: str = 'Unknown'
+    script: str = 'Unknown'
+    endangerment_level: str = 'Unknown'
+    regions: List[str] = []
+
+
+# torch and torchaudio are imported on first use so that workers which only
+# serve /health or /languages never pull them in.
+@lru_cache(maxsize=None)
+def _get_torch():
+    import torch
+    return torch
+
+
+@lru_cache(maxsize=None)
+def _get_torchaudio():
+    import torchaudio
+    return torchaudio
+
+
+def _scripted_path(model_path: Path, mtime_ns: int, int8: bool) -> Path:
+    """Name the scripted cache after the checkpoint mtime it was built from.
+
+    A cache file only matches a checkpoint with exactly that mtime, so a
+    replaced checkpoint never reuses it, even one restored with an older
+    timestamp.
+    """
+    variant = 'model.int8.scripted' if int8 else 'model.scripted'
+    return model_path.with_name(f'{variant}.{mtime_ns}.pt')
+
+
+def _build_model(model_path: Path):
+    """Construct an ASR model from its state dict checkpoint."""
+    torch = _get_torch()
+    # mmap=True maps the checkpoint instead of reading it into RAM up
+    # front; weight pages fault in on first use. Checkpoints must be
+    # saved in the zipfile format (the torch.save default) for this.
+    state_dict = torch.load(
+        model_path, map_location='cpu', mmap=True, weights_only=True)
+    # Imported here so the module, like torch itself, loads on first use
+    from lipipala.models.asr_model import ASRModel
+    model = ASRModel.from_state_dict(state_dict)
+    model.eval()
+    return model
+
+
+def _save_scripted(model, scripted_path: Path):
+    """Script a model and cache it on disk for the next process start.
+
+    Returns the eager model unchanged if it cannot be scripted.
+    """
+    torch = _get_torch()
+    try:
+        scripted = torch.jit.script(model)
+    except Exception as e:
+        logger.warning("Could not script model for %s, serving it eagerly: %s",
+                       scripted_path, e)
+        return model
+    # Write to a private temp file and rename it into place, so concurrent
+    # workers never write to or read a partially written cache file
+    tmp_name = None
+    try:
+        tmp_fd, tmp_name = tempfile.mkstemp(
+            dir=scripted_path.parent, prefix=scripted_path.name, suffix='.tmp')
+        os.close(tmp_fd)
+        torch.jit.save(scripted, tmp_name)
+        os.replace(tmp_name, scripted_path)
+        _remove_stale_scripted(scripted_path)
+    except (OSError, RuntimeError) as e:
+        logger.warning(
+            "Could not cache scripted model at %s: %s", scripted_path, e)
+        if tmp_name is not None:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_name)
+    return scripted
+
+
+def _remove_stale_scripted(scripted_path: Path) -> None:
+    """Delete caches of the same variant built from older checkpoints."""
+    variant = scripted_path.name.rsplit('.', 2)[0]
+    for stale in scripted_path.parent.glob(f'{variant}.*.pt'):
+        if stale != scripted_path:
+            with contextlib.suppress(OSError):
+                stale.unlink()
+
+
+def _load_scripted(scripted_path: Path):
+    """Load a cached scripted model, or return None if it is unusable."""
+    try:
+        return _get_torch().jit.load(scripted_path, map_location='cpu')
+    except Exception as e:
+        logger.warning(
+            "Ignoring unreadable scripted model %s: %s", scripted_path, e)
+        return None
+
+
+def _quantize(model):
+    """Quantize Linear and recurrent layers to int8 for CPU inference."""
+    torch = _get_torch()
+    return torch.quantization.quantize_dynamic(
+        model, {torch.nn.Linear, torch.nn.LSTM, torch.nn.GRU}, dtype=torch.qint8)
+
+
+def _warmup(model, n_mels: int, device: str, frames: int = 100) -> None:
+    """Run a dummy batch so one-time setup is not paid by the first request."""
+    torch = _get_torch()
+    with torch.inference_mode():
+        model(torch.zeros(1, n_mels, frames, device=device),
+              torch.tensor([frames], device=device))
+
+
+def _load(model_path: Path, mtime_ns: int, jit_cache: bool, int8: bool,
+          n_mels: int, device: str):
+    """Build or restore an ASR model and ready it for inference on device."""
+    scripted_path = _scripted_path(model_path, mtime_ns, int8)
+    model = None
+    if jit_cache and scripted_path.exists():
+        model = _load_scripted(scripted_path)
+    if model is None:
+        model = _build_model(model_path)
+        if int8:
+            model = _quantize(model)
+        if jit_cache:
+            model = _save_scripted(model, scripted_path)
+    model = model.to(device)
+    _warmup(model, n_mels, device)
+    logger.info("Lazily loaded ASR model from %s", model_path)
+    return model
+
+
+# Loaded models keyed by checkpoint path and load options, each stored with
+# the mtime of the checkpoint it was built from
+_model_cache: Dict[tuple, Tuple[int, object]] = {}
+# One lock per cache key, so loading one model never blocks requests for
+# models that are already loaded or for other languages
+_model_load_locks: Dict[tuple, threading.Lock] = {}
+_model_load_locks_guard = threading.Lock()
+
+
+def _cached_load(path_str: str, mtime_ns: int, jit_cache: bool, int8: bool,
+                 n_mels: int, device: str):
+    """Load an ASR model once per process.
+
+    Models are shared by every service instance in the process. When a
+    checkpoint's mtime changes, the model built from the old file is dropped
+    and rebuilt. Checkpoints are memory-mapped, so retrained models must be
+    written to a temporary file and renamed over model.pt; overwriting it in
+    place corrupts the pages of a model that is still serving requests.
+    """
+    key = (path_str, jit_cache, int8, n_mels, device)
+    # Fast path without locking; dict reads and writes are atomic
+    cached = _model_cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    with _model_load_locks_guard:
+        lock = _model_load_locks.setdefault(key, threading.Lock())
+    with lock:
+        # Another thread may have loaded it while this one waited
+        cached = _model_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        # Release the stale model before building its replacement
+        _model_cache.pop(key, None)
+        model = _load(Path(path_str), mtime_ns, jit_cache, int8, n_mels, device)
+        _model_cache[key] = (mtime_ns, model)
+        return model
+
 
 class SpeechRecognitionService:
     """
@@ -21,22 +206,76 @@ class SpeechRecognitionService:
 
     def __init__(self, config: SpeechRecognitionSettings):
         self.config = config
-        self._models = {}  # Cache for loaded models
         self._available_languages = self._find_available_languages()
+        self._lang_info = None
+        self._device = None
+        self._mel_transform = None
+
+    @property
+    def device(self) -> 'torch.device':
+        """Device used for feature extraction and inference."""
+        if self._device is None:
+            torch = _get_torch()
+            self._device = torch.device(
+                'cuda' if torch.cuda.is_available() else 'cpu')
+        return self._device
+
+    @property
+    def mel_transform(self):
+        """Mel spectrogram transform, built once and kept on the model device."""
+        if self._mel_transform is None:
+            torchaudio = _get_torchaudio()
+            self._mel_transform = torchaudio.transforms.MelSpectrogram(
+                sample_rate=self.config.sample_rate,
+                n_fft=self.config.n_fft,
+                hop_length=self.config.hop_length,
+                n_mels=self.config.n_mels,
+            ).to(self.device)
+        return self._mel_transform
+
+    @property
+    def lang_info(self) -> Dict[str, LanguageMeta]:
+        """Language metadata, read on first use rather than at import."""
+        if self._lang_info is None:
+            self._lang_info = self._load_languages_metadata()
+        return self._lang_info
 
     def _find_available_languages(self) -> List[str]:
         """Find all model directories to determine available languages."""
         if not self.config.models_dir.exists():
             logger.warning(
-                f"Models directory not found: {self.config.models_dir}")
+                "Models directory not found: %s", self.config.models_dir)
             return []
-        return [d.name for d in self.config.models_dir.iterdir() if d.is_dir()]
+        # DirEntry.is_dir() uses the d_type from readdir, avoiding a stat per entry
+        with os.scandir(self.config.models_dir) as entries:
+            return [e.name for e in entries if e.is_dir()]
+
+    def _load_languages_metadata(self) -> Dict[str, LanguageMeta]:
+        """Read language metadata once for every available language."""
+        raw = {}
+        try:
+            raw = orjson.loads(self.config.languages_metadata_path.read_bytes())
+        except (OSError, ValueError) as e:
+            logger.warning("Could not read language metadata: %s", e)
+        if not isinstance(raw, dict):
+            logger.warning("Language metadata must be a JSON object, ignoring it")
+            raw = {}
+
+        lang_info = {}
+        for code in self._available_languages:
+            entry = raw.get(code, {})
+            if not isinstance(entry, dict):
+                logger.warning("Metadata for language %s must be a JSON object", code)
+                entry = {}
+            try:
+                lang_info[code] = LanguageMeta(**{'name': code, **entry})
+            except ValidationError as e:
+                logger.warning("Invalid metadata for language %s: %s", code, e)
+                lang_info[code] = LanguageMeta(name=code)
+        return lang_info
 
     def _load_model(self, lang_code: str):
         """Loads a single ASR model into memory on demand."""
-        if lang_code in self._models:
-            return self._models[lang_code]
-
         if lang_code not in self._available_languages:
             raise LanguageNotSupportedError(
                 f"Language '{lang_code}' is not supported.")
@@ -46,47 +285,147 @@ class SpeechRecognitionService:
             raise ModelLoadError(
                 f"Model file for language '{lang_code}' not found at {model_path}")
 
+        # Dynamic int8 kernels only exist for CPU
+        int8 = self.config.int8_cpu and self.device.type == 'cpu'
         try:
-            # This is a placeholder for your actual model loading logic
-            # from lipipala.models.asr_model import ASRModel
-            # model = ASRModel(...)
-            # model.load_state_dict(torch.load(model_path, map_location='cpu'))
-            # Replace with real model object
-            model = {"type": "dummy_model", "lang": lang_code}
-            model.eval()  # _model.eval()
-            self._models[lang_code] = model
-            logger.info(f"Lazily loaded ASR model for language: {lang_code}")
-            return model
+            return _cached_load(str(model_path), model_path.stat().st_mtime_ns,
+                                self.config.jit_cache, int8, self.config.n_mels,
+                                str(self.device))
         except Exception as e:
-            logger.error(f"Error loading model for language {lang_code}: {e}")
+            logger.error("Error loading model for language %s: %s", lang_code, e)
             raise ModelLoadError(
                 f"Could not load model for language {lang_code}.") from e
 
+    def preload_models(self) -> None:
+        """Load every available model now instead of on first request.
+
+        This picks and initialises the inference device, so it must run in
+        the serving process and never in one that forks workers afterwards.
+        """
+        for lang_code in self._available_languages:
+            try:
+                self._load_model(lang_code)
+            except ModelLoadError as e:
+                logger.warning("Skipping preload for %s: %s", lang_code, e)
+
+    def _load_audio(self, source: AudioSource) -> 'torch.Tensor':
+        """Load audio as a normalized mono waveform on the model device."""
+        if isinstance(source, Path):
+            source = str(source)
+        data, sr = soundfile.read(source, dtype='float32', always_2d=False)
+        if data.ndim > 1:
+            data = data.mean(axis=1, dtype=np.float32)
+        np.divide(data, np.abs(data).max() + 1e-9, out=data)
+        waveform = _get_torch().from_numpy(data)
+        if self.device.type == 'cuda':
+            # A pinned source lets the copy to the GPU run asynchronously
+            waveform = waveform.pin_memory().to(self.device, non_blocking=True)
+        if sr != self.config.sample_rate:
+            waveform = _get_torchaudio().functional.resample(
+                waveform, sr, self.config.sample_rate)
+        return waveform
+
+    def _extract_features(self, waveforms: List['torch.Tensor']) -> Tuple['torch.Tensor', 'torch.Tensor']:
+        """Compute log-mel features for a batch of waveforms in one pass.
+
+        Waveforms are zero-padded to the longest one and stacked into a
+        single ``(B, T)`` tensor, giving ``(B, n_mels, frames)`` features and
+        the number of valid frames per item.
+        """
+        torch = _get_torch()
+        batch = torch.nn.utils.rnn.pad_sequence(waveforms, batch_first=True)
+        mel = self.mel_transform(batch)
+        # Log-compress in place rather than allocating two more
+        # (B, n_mels, frames) tensors per request
+        mel.add_(1e-6).log_()
+        lengths = torch.tensor([w.shape[-1] // self.config.hop_length + 1
+                                for w in waveforms], device=mel.device)
+        return mel, lengths
+
     def transcribe(self, audio_path: Union[str, Path], language: str) -> Dict:
         """Transcribe an audio file to text."""
+        return self._transcribe([audio_path], language)[0]
+
+    def transcribe_stream(self, fileobj: BinaryIO, language: str) -> Dict:
+        """Transcribe audio read from an open binary file object."""
+        return self._transcribe([fileobj], language)[0]
+
+    def batch_transcribe(self, audio_paths: List[Union[str, Path]], language: str) -> List[Dict]:
+        """Transcribe several audio files, batching up to max_batch_size per forward pass."""
+        size = self.config.max_batch_size
+        results = []
+        for start in range(0, len(audio_paths), size):
+            results.extend(self._transcribe(audio_paths[start:start + size], language))
+        return results
+
+    def _transcribe(self, sources: List[AudioSource], language: str) -> List[Dict]:
         model = self._load_model(language)
 
+        if len(sources) == 1:
+            waveforms = [self._load_source(sources[0])]
+        else:
+            # Decoding is mostly file I/O and GIL-free resampling
+            workers = min(MAX_AUDIO_LOAD_WORKERS, len(sources))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                waveforms = list(executor.map(self._load_source, sources))
+
         try:
-            # Placeholder for your audio processing and transcription logic
-            # audio_data, _ = librosa.load(audio_path, sr=self.config.sample_rate)
-            # normalized_audio = librosa.util.normalize(audio_data)
-            # features = self.preprocessor.process(normalized_audio)
-            # ... run model ...
+            features, lengths = self._extract_features(waveforms)
+            torch = _get_torch()
+            with torch.inference_mode():
+                # Models return (B, T', V) logits plus the valid output
+                # frames per item, since T' shrinks if the encoder subsamples
+                outputs, output_lengths = model(features, lengths)
+                if outputs.dim() != 3 or outputs.shape[0] != len(sources):
+                    raise ValueError(
+                        f"Expected (B, T, V) logits, got {tuple(outputs.shape)}")
+                # Decoding and confidence both work from log-probabilities
+                log_probs = torch.nn.functional.log_softmax(outputs, dim=-1)
+        except Exception as e:
+            label = self._describe_sources(sources)
+            logger.error("Error processing audio %s: %s", label, e)
+            raise AudioProcessingError(
+                f"Failed to process audio: {label}") from e
+
+        results = []
+        for waveform, item_log_probs, n_frames in zip(waveforms, log_probs,
+                                                       output_lengths.tolist()):
+            item_log_probs = item_log_probs[:n_frames]
+            # Placeholder for decoding item_log_probs to text
             transcription = f"This is a dummy transcription for {language}."
-            confidence = 0.95
-            duration = 10.5
+            confidence = float(item_log_probs.max().exp())
+            results.append({
+                'language': language,
+                'text': transcription,
+                'confidence': confidence,
+                'audio_duration': waveform.shape[-1] / self.config.sample_rate,
+            })
+        return results
+
+    def _load_source(self, source: AudioSource) -> 'torch.Tensor':
+        """Load one source, naming it in the error if it cannot be decoded."""
+        try:
+            return self._load_audio(source)
         except Exception as e:
-            logger.error(f"Error processing audio file {audio_path}: {e}")
+            label = self._describe_sources([source])
+            logger.error("Error processing audio %s: %s", label, e)
             raise AudioProcessingError(
-                f"Failed to process audio: {audio_path}") from e
+                f"Failed to process audio: {label}") from e
 
-        return {
-            'language': language,
-            'text': transcription,
-            'confidence': confidence,
-            'audio_duration': duration,
-        }
+    @staticmethod
+    def _describe_sources(sources: List[AudioSource]) -> str:
+        if len(sources) > 1:
+            return f"batch of {len(sources)} files"
+        source = sources[0]
+        return str(source) if isinstance(source, (str, Path)) else 'stream'
 
     def get_supported_languages(self) -> List[str]:
         """Get a list of supported language codes."""
         return self._available_languages
+
+    def get_language_info(self, lang_code: str) -> LanguageMeta:
+        """Get the metadata of a supported language."""
+        if lang_code not in self._available_languages:
+            raise LanguageNotSupportedError(
+                f"Language '{lang_code}' is not supported.")
+        return self.lang_info[lang_code]
@@ -1,7 +1,27 @@
-from lipipala.app import create_app
+import os
+from pathlib import Path
+
 from lipipala.config import settings
 
-app = create_app()
+GUNICORN_CONF = Path(__file__).resolve().parent.parent / 'gunicorn_conf.py'
+
+
+def __getattr__(name):
+    # Build the app on first access so `gunicorn lipipala.main:app` and
+    # `flask --app lipipala.main` keep working without the launcher below
+    # paying for it.
+    if name == 'app':
+        from lipipala.app import create_app
+        app = globals()['app'] = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == '__main__':
-    app.run(host=settings.host, port=settings.port, debug=settings.debug)
+    if settings.debug:
+        from lipipala.app import create_app
+        app = create_app()
+        app.run(host=settings.host, port=settings.port, debug=settings.debug)
+    else:
+        # Exec before building the app so the launcher never loads the service
+        os.execvp('gunicorn', ['gunicorn', '-c', str(GUNICORN_CONF),
+                               'lipipala.app:create_app(preload_models=True)'])
@@ -0,0 +1,37 @@
+from typing import Dict, Tuple
+
+import torch
+from torch import nn
+
+
+class ASRModel(nn.Module):
+    """Placeholder acoustic model: a per-frame linear CTC head over log-mel features.
+
+    It has no encoder, so it transcribes nothing useful, but it follows the
+    contract the speech service relies on and can stand in for a trained
+    model until one lands. Checkpoints are its ``state_dict()`` saved with
+    ``torch.save``.
+
+    ``forward`` takes ``(B, n_mels, T)`` features with the valid frame count
+    of each item and returns ``(B, T', V)`` logits with the valid output
+    frame count of each item. A real encoder that subsamples in time must
+    return its shortened lengths.
+    """
+
+    def __init__(self, n_mels: int = 80, vocab_size: int = 32):
+        super().__init__()
+        self.proj = nn.Linear(n_mels, vocab_size)
+
+    def forward(self, features: torch.Tensor,
+                lengths: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        return self.proj(features.transpose(1, 2)), lengths
+
+    @classmethod
+    def from_state_dict(cls, state_dict: Dict[str, torch.Tensor]) -> 'ASRModel':
+        """Build a model sized to match a checkpoint and adopt its tensors."""
+        vocab_size, n_mels = state_dict['proj.weight'].shape
+        model = cls(n_mels=n_mels, vocab_size=vocab_size)
+        # assign=True keeps the (possibly memory-mapped) checkpoint tensors
+        # instead of copying them into freshly allocated parameters
+        model.load_state_dict(state_dict, assign=True)
+        return model
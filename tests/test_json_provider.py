@@ -0,0 +1,50 @@
+import datetime
+import decimal
+import uuid
+
+import pytest
+
+flask = pytest.importorskip("flask")
+
+from lipipala.api.json_provider import ORJSONProvider
+
+
+@pytest.fixture
+def app():
+    app = flask.Flask(__name__)
+    app.json = ORJSONProvider(app)
+    return app
+
+
+@pytest.mark.parametrize("obj", [
+    {"a": [1, 2.5, None, True], "b": {"c": "ä"}},
+    {1: "x", 2: "y"},
+    {"when": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+     "day": datetime.date(2024, 1, 2)},
+    {"id": uuid.UUID(int=1), "amount": decimal.Decimal("1.50")},
+])
+def test_output_matches_default_provider(app, obj):
+    default = flask.json.provider.DefaultJSONProvider(app)
+
+    assert app.json.loads(app.json.dumps(obj)) == default.loads(default.dumps(obj))
+
+
+def test_jsonify_response(app):
+    with app.app_context():
+        response = flask.jsonify({1: "x"}, 2)
+
+    assert response.mimetype == "application/json"
+    assert response.get_json() == [{"1": "x"}, 2]
+
+
+def test_sort_keys_and_indent(app):
+    assert app.json.dumps({"b": 1, "a": 2}, sort_keys=True, indent=2) == '{\n  "a": 2,\n  "b": 1\n}'
+
+
+@pytest.mark.parametrize("call", [
+    lambda provider: provider.dumps({}, separators=(",", ":")),
+    lambda provider: provider.loads("{}", parse_float=decimal.Decimal),
+])
+def test_unsupported_arguments_raise(app, call):
+    with pytest.raises(TypeError, match="Unsupported arguments"):
+        call(app.json)
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from lipipala.config import SpeechRecognitionSettings
+from lipipala.core.speech.exceptions import LanguageNotSupportedError
+from lipipala.core.speech.service import LanguageMeta, SpeechRecognitionService
+
+
+@pytest.fixture
+def make_service(tmp_path):
+    models_dir = tmp_path / "models"
+    for code in ("kru", "tcy"):
+        (models_dir / code).mkdir(parents=True)
+    metadata_path = tmp_path / "metadata.json"
+
+    def _make(metadata_text):
+        metadata_path.write_text(metadata_text, encoding="utf-8")
+        config = SpeechRecognitionSettings(
+            models_dir=models_dir, languages_metadata_path=metadata_path)
+        return SpeechRecognitionService(config)
+
+    return _make
+
+
+def test_metadata_is_parsed_into_language_meta(make_service):
+    service = make_service(json.dumps({
+        "kru": {"name": "Kurukh", "family": "Dravidian", "script": "Tolong Siki",
+                "endangerment_level": "Vulnerable", "regions": ["Jharkhand"]},
+    }))
+
+    assert service.get_language_info("kru") == LanguageMeta(
+        name="Kurukh", family="Dravidian", script="Tolong Siki",
+        endangerment_level="Vulnerable", regions=["Jharkhand"])
+
+
+def test_missing_fields_and_languages_use_defaults(make_service):
+    service = make_service(json.dumps({"kru": {"family": "Dravidian"}}))
+
+    assert service.get_language_info("kru") == LanguageMeta(name="kru", family="Dravidian")
+    assert service.get_language_info("tcy") == LanguageMeta(name="tcy")
+
+
+@pytest.mark.parametrize("metadata_text", [
+    "not json",
+    json.dumps(["kru", "tcy"]),
+    json.dumps({"kru": "Kurukh", "tcy": ["Tulu"]}),
+    json.dumps({"kru": {"regions": "Jharkhand"}, "tcy": {"name": None}}),
+])
+def test_malformed_metadata_falls_back_to_defaults(make_service, metadata_text):
+    service = make_service(metadata_text)
+
+    assert service.get_language_info("kru") == LanguageMeta(name="kru")
+    assert service.get_language_info("tcy") == LanguageMeta(name="tcy")
+
+
+def test_supported_languages_are_codes(make_service):
+    service = make_service("{}")
+
+    assert sorted(service.get_supported_languages()) == ["kru", "tcy"]
+
+
+def test_unknown_language_info_raises(make_service):
+    service = make_service("{}")
+
+    with pytest.raises(LanguageNotSupportedError):
+        service.get_language_info("xyz")
+
+
+def test_metadata_is_read_on_first_use(make_service, tmp_path):
+    service = make_service("{}")
+    (tmp_path / "metadata.json").write_text(json.dumps({"kru": {"name": "Kurukh"}}))
+
+    assert service.get_language_info("kru").name == "Kurukh"
+
+
+def test_language_info_endpoint(make_service, monkeypatch):
+    pytest.importorskip("flask")
+    from lipipala.api.v1 import routes
+    from lipipala.app import create_app
+
+    monkeypatch.setattr(routes, "speech_service", make_service(json.dumps({
+        "kru": {"name": "Kurukh", "family": "Dravidian"},
+    })))
+    client = create_app().test_client()
+
+    response = client.get("/api/v1/speech/languages/kru")
+    assert response.status_code == 200
+    assert response.get_json() == {
+        "code": "kru", "name": "Kurukh", "family": "Dravidian", "script": "Unknown",
+        "endangerment_level": "Unknown", "regions": []}
+    assert client.get("/api/v1/speech/languages/xyz").status_code == 404
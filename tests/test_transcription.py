@@ -0,0 +1,197 @@
+import io
+import os
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("torchaudio")
+soundfile = pytest.importorskip("soundfile")
+
+from lipipala.config import SpeechRecognitionSettings
+from lipipala.core.speech import service as service_module
+from lipipala.core.speech.exceptions import AudioProcessingError
+from lipipala.core.speech.service import SpeechRecognitionService
+
+
+class TinyModel(torch.nn.Module):
+    """Per-frame projection following the (logits, output_lengths) contract."""
+
+    def __init__(self, n_mels: int = 80, vocab_size: int = 5):
+        super().__init__()
+        self.proj = torch.nn.Linear(n_mels, vocab_size)
+
+    def forward(self, features: torch.Tensor, lengths: torch.Tensor):
+        return self.proj(features.transpose(1, 2)), lengths
+
+
+class UnscriptableModel(TinyModel):
+    def forward(self, features, lengths, *extra):
+        return super().forward(features, lengths)
+
+
+@pytest.fixture(autouse=True)
+def clear_model_cache():
+    service_module._model_cache.clear()
+    yield
+    service_module._model_cache.clear()
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    """Replace checkpoint loading with TinyModel and record each build."""
+    calls = []
+
+    def _build_model(model_path):
+        calls.append(model_path)
+        return TinyModel().eval()
+
+    monkeypatch.setattr(service_module, "_build_model", _build_model)
+    return calls
+
+
+@pytest.fixture
+def make_service(tmp_path):
+    models_dir = tmp_path / "models"
+    (models_dir / "kru").mkdir(parents=True)
+    torch.save({}, models_dir / "kru" / "model.pt")
+    metadata_path = tmp_path / "metadata.json"
+    metadata_path.write_text("{}", encoding="utf-8")
+
+    def _make(**options):
+        options.setdefault("int8_cpu", False)
+        config = SpeechRecognitionSettings(
+            models_dir=models_dir, languages_metadata_path=metadata_path, **options)
+        return SpeechRecognitionService(config)
+
+    return _make
+
+
+@pytest.fixture
+def write_wav(tmp_path):
+    def _write(name, seconds, sample_rate=16000, channels=1):
+        rng = np.random.default_rng(0)
+        shape = (int(seconds * sample_rate), channels) if channels > 1 else int(seconds * sample_rate)
+        path = tmp_path / name
+        soundfile.write(path, (0.1 * rng.standard_normal(shape)).astype("float32"), sample_rate)
+        return path
+
+    return _write
+
+
+def assert_result(result, duration):
+    assert result["language"] == "kru"
+    assert result["audio_duration"] == pytest.approx(duration, abs=1e-3)
+    assert 0 < result["confidence"] <= 1
+
+
+@pytest.mark.parametrize("sample_rate, channels", [(16000, 1), (8000, 1), (16000, 2)])
+def test_transcribe_file(make_service, builds, write_wav, sample_rate, channels):
+    path = write_wav("clip.wav", 0.5, sample_rate, channels)
+
+    assert_result(make_service().transcribe(path, "kru"), 0.5)
+
+
+def test_transcribe_stream(make_service, builds, write_wav):
+    path = write_wav("clip.wav", 0.75, 8000)
+
+    with open(path, "rb") as f:
+        assert_result(make_service().transcribe_stream(io.BytesIO(f.read()), "kru"), 0.75)
+
+
+def test_batch_transcribe_keeps_order_across_chunks(make_service, builds, write_wav):
+    durations = [0.25, 1.0, 0.5, 0.75, 0.3]
+    paths = [write_wav(f"clip{i}.wav", d, 16000 if i % 2 else 8000, 1 + i % 2)
+             for i, d in enumerate(durations)]
+
+    results = make_service(max_batch_size=2).batch_transcribe(paths, "kru")
+
+    assert len(results) == len(durations)
+    for result, duration in zip(results, durations):
+        assert_result(result, duration)
+
+
+def test_batch_transcribe_empty(make_service, builds):
+    assert make_service().batch_transcribe([], "kru") == []
+
+
+def test_batch_error_names_failing_file(make_service, builds, write_wav, tmp_path):
+    bad = tmp_path / "broken.wav"
+    bad.write_bytes(b"not audio")
+
+    with pytest.raises(AudioProcessingError, match="broken.wav"):
+        make_service().batch_transcribe([write_wav("ok.wav", 0.5), bad], "kru")
+
+
+def test_model_is_cached_across_services(make_service, builds, write_wav):
+    path = write_wav("clip.wav", 0.5)
+
+    make_service().transcribe(path, "kru")
+    make_service().transcribe(path, "kru")
+
+    assert len(builds) == 1
+
+
+def test_model_is_rebuilt_when_checkpoint_changes(make_service, builds, write_wav, tmp_path):
+    path = write_wav("clip.wav", 0.5)
+    service = make_service()
+    service.transcribe(path, "kru")
+
+    checkpoint = tmp_path / "models" / "kru" / "model.pt"
+    mtime_ns = checkpoint.stat().st_mtime_ns
+    os.utime(checkpoint, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+    service.transcribe(path, "kru")
+
+    assert len(builds) == 2
+
+
+def test_int8_model_is_quantized(make_service, builds, write_wav):
+    service = make_service(int8_cpu=True)
+
+    assert_result(service.transcribe(write_wav("clip.wav", 0.5), "kru"), 0.5)
+    model = service._load_model("kru")
+    assert type(model.proj).__module__.startswith("torch.ao.nn.quantized")
+
+
+@pytest.mark.parametrize("int8", [False, True])
+def test_jit_cache_round_trip(make_service, builds, write_wav, tmp_path, int8):
+    path = write_wav("clip.wav", 0.5)
+    service = make_service(jit_cache=True, int8_cpu=int8)
+    service.transcribe(path, "kru")
+    assert len(list((tmp_path / "models" / "kru").glob("*.scripted.*.pt"))) == 1
+
+    service_module._model_cache.clear()
+    assert_result(service.transcribe(path, "kru"), 0.5)
+
+    assert len(builds) == 1
+    assert isinstance(service._load_model("kru"), torch.jit.ScriptModule)
+
+
+def test_jit_cache_ignores_other_checkpoint_versions(make_service, builds, write_wav, tmp_path):
+    path = write_wav("clip.wav", 0.5)
+    service = make_service(jit_cache=True)
+    service.transcribe(path, "kru")
+
+    # Going back to an older timestamp must not reuse the cache either
+    checkpoint = tmp_path / "models" / "kru" / "model.pt"
+    os.utime(checkpoint, ns=(1, 1))
+    service.transcribe(path, "kru")
+
+    assert len(builds) == 2
+    cached = list((tmp_path / "models" / "kru").glob("*.scripted.*.pt"))
+    assert [p.name for p in cached] == ["model.scripted.1.pt"]
+
+
+def test_unscriptable_model_is_served_eagerly(make_service, monkeypatch, write_wav):
+    monkeypatch.setattr(service_module, "_build_model", lambda path: UnscriptableModel().eval())
+    service = make_service(jit_cache=True)
+
+    assert_result(service.transcribe(write_wav("clip.wav", 0.5), "kru"), 0.5)
+    assert isinstance(service._load_model("kru"), UnscriptableModel)
+
+
+def test_placeholder_checkpoint_loads(make_service, write_wav, tmp_path):
+    from lipipala.models.asr_model import ASRModel
+    torch.save(ASRModel(vocab_size=7).state_dict(), tmp_path / "models" / "kru" / "model.pt")
+
+    assert_result(make_service().transcribe(write_wav("clip.wav", 0.5), "kru"), 0.5)